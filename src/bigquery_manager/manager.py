@@ -1,9 +1,79 @@
-from google.cloud.bigquery import QueryJobConfig, ScalarQueryParameter
+import asyncio
+import time
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from google.cloud.bigquery import (
+    ArrayQueryParameter,
+    AutoRowIDs,
+    LoadJobConfig,
+    QueryJob,
+    QueryJobConfig,
+    QueryPriority,
+    ScalarQueryParameter,
+    TableReference
+)
+
+_ARRAY_TYPES = (list, tuple, set, frozenset)
+
+def _filter_clause(col: dict) -> str:
+    """Build a WHERE predicate for a filter; `"op": "IN"` matches a list."""
+    name = col.get("name")
+    value = col.get("value")
+    if col.get("op") == "IN":
+        if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+            raise ValueError(f"IN filter {name!r} needs a list of values")
+        return f"{name} IN UNNEST(@{name})"
+    if isinstance(value, _ARRAY_TYPES):
+        raise ValueError(f'Filter {name!r} has a list value but no "op": "IN"')
+    return f"{name} = @{name}"
+
+def _convert_param(param: dict):
+    """Convert a single parameter to a BigQuery query parameter; list values
+    and `"op": "IN"` filters become ArrayQueryParameters."""
+    name = param.get("name")
+    type_ = param.get("type")
+    value = param.get("value")
+    if param.get("op") == "IN" or isinstance(value, _ARRAY_TYPES):
+        return ArrayQueryParameter(name, type_, list(value))
+    return ScalarQueryParameter(name, type_, value)
+
+def _offset_errors(errors: list, start: int) -> list:
+    """Shift chunk-relative row indexes in insert errors to the full data."""
+    if not start:
+        return errors
+    return [{**error, "index": error["index"] + start} for error in errors]
+
+@lru_cache(maxsize=256)
+def _invoke_sql(sp: str, arity: int) -> str:
+    """Build the CALL statement for a stored procedure and arity once."""
+    if not sp.startswith("`"):
+        sp = f"`{sp}`"
+    placeholders = ", ".join("?" * arity)
+    return f"CALL {sp}({placeholders});"
+
+_CACHE_MAXSIZE = 1024
 
 class BigQueryManager:
-    def __init__(self, bq_client):
-        """Initialize the BigQueryManager with a BigQuery client."""
+    __slots__ = (
+        "client",
+        "_cache_ttl",
+        "_table_cache",
+        "_write_client",
+        "_service_item_cache"
+    )
+
+    def __init__(self, bq_client, cache_ttl: float=300):
+        """Initialize the BigQueryManager with a BigQuery client.
+
+        Cached lookups expire after `cache_ttl` seconds, or never if None.
+        """
         self.client = bq_client
+        self._cache_ttl = cache_ttl
+        self._table_cache = {}
+        self._write_client = None
+        self._service_item_cache = {}
 
     @staticmethod
     def __generate_invoke_sql(
@@ -11,8 +81,7 @@ class BigQueryManager:
         params: list[dict]=None
     ) -> str:
         """Generate SQL for invoking a stored procedure."""
-        placeholders = ", ".join(["?" for _ in (params or [])])
-        return f"CALL `{sp}`({placeholders});"
+        return _invoke_sql(sp, len(params or ()))
 
     @staticmethod
     def __generate_select_sql(
@@ -21,25 +90,19 @@ class BigQueryManager:
         filters: list[dict]=None
     ) -> str:
         """Generate SQL for a SELECT query."""
-        sql = f"SELECT {select} FROM `{table}`"
+        parts = ["SELECT ", select, " FROM `", table, "`"]
         if isinstance(filters, list) and filters:
-            query_filter = [
-                f"{col.get('name')} = @{col.get('name')}" for col in filters
-            ]
-            return sql + " WHERE " + " AND ".join(query_filter) + ";"
-        return sql + ";"
+            parts += (" WHERE ", " AND ".join(map(_filter_clause, filters)))
+        parts.append(";")
+        return "".join(parts)
 
     @staticmethod
     def __convert_params(
         params: list[dict]=None
-    ) -> list[ScalarQueryParameter] | None:
-        """Convert parameters to BigQuery ScalarQueryParameters."""
+    ) -> list[ScalarQueryParameter | ArrayQueryParameter] | None:
+        """Convert parameters to BigQuery query parameters."""
         return [
-            ScalarQueryParameter(
-                param.get("name"),
-                param.get("type"),
-                param.get("value")
-            ) for param in params
+            _convert_param(param) for param in params
         ] if params else None
 
     @staticmethod
@@ -47,21 +110,114 @@ class BigQueryManager:
         """Set the job configuration for a BigQuery query."""
         return QueryJobConfig(**job_configs) if job_configs else None
 
+    def __cached(self, cache: dict, key, loader):
+        """Return the cached value for key, calling loader on miss or expiry."""
+        now = time.monotonic()
+        entry = cache.get(key)
+        if entry is not None and (
+            self._cache_ttl is None or now - entry[1] < self._cache_ttl
+        ):
+            return entry[0]
+        value = loader()
+        if key not in cache and len(cache) >= _CACHE_MAXSIZE:
+            # Evict the oldest entry; dicts keep insertion order.
+            del cache[next(iter(cache))]
+        cache[key] = (value, now)
+        return value
+
+    def __get_table(self, table: str):
+        """Get a BigQuery table, reusing previously fetched metadata."""
+        return self.__cached(
+            self._table_cache,
+            table,
+            lambda: self.client.get_table(table)
+        )
+
+    def __get_write_client(self):
+        """Get a Storage Write API client sharing the BigQuery credentials.
+
+        The credentials are read from the client's private `_credentials`
+        attribute, as `google-cloud-bigquery` does for its own Storage API
+        clients, so no separate credentials need to be configured.
+        """
+        if self._write_client is None:
+            from google.cloud.bigquery_storage_v1 import BigQueryWriteClient
+            self._write_client = BigQueryWriteClient(
+                credentials=self.client._credentials
+            )
+        return self._write_client
+
+    def clear_cache(self):
+        """Drop all cached lookups."""
+        self._table_cache.clear()
+        self._service_item_cache.clear()
+
     @staticmethod
     def get_one_result(query_res):
-        """Get the first result from a BigQuery query result."""
+        """Get the first result from a BigQuery query result.
+
+        Results known to be empty return None without fetching any page.
+        """
+        if getattr(query_res, "total_rows", None) == 0:
+            return None
         row = next(iter(query_res), None)
         return row[0] if row else None
 
-    def query(self, sql: str, params: list[dict]=None, **job_configs):
-        """Execute a BigQuery SQL query."""
+    def submit(
+        self,
+        sql: str,
+        params: list[dict]=None,
+        batch: bool=False,
+        **job_configs
+    ) -> QueryJob:
+        """Start a BigQuery SQL query and return its job without waiting.
+
+        With `batch`, the job runs at BATCH priority and waits for idle slots
+        instead of using interactive quota.
+        """
+        if not (params or batch or job_configs):
+            return self.client.query(query=sql)
+        if batch:
+            job_configs['priority'] = QueryPriority.BATCH
         if params:
             job_configs['query_parameters'] = self.__convert_params(params)
         job_config = self.__set_job_config(**job_configs)
         return self.client.query(
             query=sql,
             job_config=job_config
-        ).result()
+        )
+
+    def query(self, sql: str, params: list[dict]=None, **job_configs):
+        """Execute a BigQuery SQL query and wait for its result.
+
+        Accepts the same options as `submit`; `invoke` and `select` forward
+        them here.
+        """
+        return self.submit(sql, params, **job_configs).result()
+
+    def query_arrow(self, sql: str, params: list[dict]=None, **job_configs):
+        """Execute a BigQuery SQL query and return a pyarrow Table.
+
+        Results are downloaded through the BigQuery Storage Read API.
+        Requires the `storage` extra.
+        """
+        return self.submit(sql, params, **job_configs).to_arrow(
+            create_bqstorage_client=True
+        )
+
+    def query_df(self, sql: str, params: list[dict]=None, **job_configs):
+        """Execute a BigQuery SQL query and return a pandas DataFrame.
+
+        Results are downloaded through the BigQuery Storage Read API.
+        Requires the `storage` and `pandas` extras.
+        """
+        return self.submit(sql, params, **job_configs).to_dataframe(
+            create_bqstorage_client=True
+        )
+
+    async def aquery(self, sql: str, params: list[dict]=None, **job_configs):
+        """Execute a BigQuery SQL query without blocking the event loop."""
+        return await asyncio.to_thread(self.query, sql, params, **job_configs)
 
     def invoke(self, sp: str, params: list[dict]=None, **job_configs):
         """Invoke a stored procedure in BigQuery."""
@@ -84,27 +240,155 @@ class BigQueryManager:
         destination_table: str,
         data,
         selected_fields=None,
+        chunk_size: int=500,
+        parallelism: int=8,
+        json_rows: bool=False,
         **kwargs
     ):
-        """Insert data into a BigQuery table."""
+        """Insert data into a BigQuery table in chunks of `chunk_size` rows,
+        submitting up to `parallelism` chunks concurrently.
+
+        With `json_rows`, dict rows are sent as-is through `insert_rows_json`,
+        skipping the schema conversion, so their values must already be JSON
+        serializable.
+
+        Rows are built from the table schema cached for `cache_ttl` seconds.
+        Columns added to the table within that window are left out of dict
+        rows until the cache expires or `clear_cache` is called.
+        """
+        if not isinstance(data, Sequence):
+            data = list(data)
         if not data:
             return
-        res = self.client.insert_rows(
-            self.client.get_table(destination_table),
-            data,
-            selected_fields,
-            **kwargs
+        if json_rows and selected_fields is not None:
+            raise ValueError("selected_fields cannot be used with json_rows")
+        table = self.__get_table(destination_table)
+        if json_rows:
+            insert_rows, args = self.client.insert_rows_json, ()
+        else:
+            insert_rows, args = self.client.insert_rows, (selected_fields,)
+        starts = range(0, len(data), chunk_size)
+        chunks = [data[start:start + chunk_size] for start in starts]
+        chunk_kwargs = [kwargs] * len(chunks)
+        row_ids = kwargs.get("row_ids")
+        if row_ids is not None and not isinstance(row_ids, AutoRowIDs):
+            # Explicit insert IDs are consumed from the start on every call,
+            # so each chunk needs its own slice.
+            row_ids = list(row_ids)
+            chunk_kwargs = [
+                {**kwargs, "row_ids": row_ids[start:start + chunk_size]}
+                for start in starts
+            ]
+        if len(chunks) == 1:
+            results = [insert_rows(table, chunks[0], *args, **chunk_kwargs[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(parallelism, len(chunks))
+            ) as executor:
+                futures = [
+                    executor.submit(insert_rows, table, chunk, *args, **kw)
+                    for chunk, kw in zip(chunks, chunk_kwargs)
+                ]
+                results = [future.result() for future in futures]
+        errors = []
+        for start, res in zip(starts, results):
+            if res:
+                errors.extend(_offset_errors(res, start))
+        if errors:
+            raise RuntimeError(errors)
+
+    def bulk_insert(
+        self,
+        destination_table: str,
+        rows: list,
+        proto_descriptor,
+        chunk_size: int=500
+    ):
+        """Append protobuf rows to a BigQuery table through the default
+        stream of the Storage Write API.
+
+        `proto_descriptor` is the message descriptor of `rows`. The write
+        client reuses the BigQuery client's credentials. Requires the
+        `storage` extra (google-cloud-bigquery-storage).
+        """
+        if not rows:
+            return
+        from google.cloud.bigquery_storage_v1 import types
+        from google.protobuf import descriptor_pb2
+
+        table = TableReference.from_string(
+            destination_table,
+            default_project=self.client.project
+        )
+        stream = f"{table.path.lstrip('/')}/streams/_default"
+        descriptor = descriptor_pb2.DescriptorProto()
+        proto_descriptor.CopyToProto(descriptor)
+        writer_schema = types.ProtoSchema(proto_descriptor=descriptor)
+        requests = [
+            types.AppendRowsRequest(
+                write_stream=stream,
+                proto_rows=types.AppendRowsRequest.ProtoData(
+                    writer_schema=writer_schema,
+                    rows=types.ProtoRows(serialized_rows=[
+                        row.SerializeToString()
+                        for row in rows[start:start + chunk_size]
+                    ])
+                )
+            ) for start in range(0, len(rows), chunk_size)
+        ]
+        responses = self.__get_write_client().append_rows(
+            iter(requests),
+            metadata=(("x-goog-request-params", f"write_stream={stream}"),)
         )
-        if res:
-            raise RuntimeError(res)
+        errors = []
+        for response in responses:
+            if response.row_errors:
+                errors.extend(response.row_errors)
+            elif response.error.code:
+                errors.append(response.error)
+        if errors:
+            raise RuntimeError(errors)
+
+    def bulk_insert_df(self, destination_table: str, df, **job_configs):
+        """Load a pandas DataFrame into a BigQuery table as a load job.
+
+        The frame is encoded column by column to Parquet with pyarrow.
+        Requires the `pandas` extra.
+        """
+        job_config = LoadJobConfig(**job_configs) if job_configs else None
+        return self.client.load_table_from_dataframe(
+            df,
+            destination_table,
+            job_config=job_config
+        ).result()
 
     def get_last_id(self, destination_table: str) -> int:
         """Get the last ID from a BigQuery table."""
-        last_id = self.select(destination_table, "MAX(Id)")
+        sql = self.__generate_select_sql(destination_table, "MAX(Id)")
+        last_id = self.client.query(query=sql).result()
         return self.get_one_result(last_id) or 0
 
-    def get_service_item(self, item_table: str, item: str):
-        """Get a service item from a BigQuery table."""
+    def get_service_item(
+        self,
+        item_table: str,
+        item: str,
+        cached: bool=False
+    ):
+        """Get a service item from a BigQuery table.
+
+        With `cached`, the value is memoized per instance until `cache_ttl`
+        expires or `clear_cache` is called.
+        """
+        if not cached:
+            return self.__select_service_item(item_table, item)
+        return self.__cached(
+            self._service_item_cache,
+            (item_table, item),
+            lambda: self.__select_service_item(item_table, item)
+        )
+
+    def __select_service_item(self, item_table: str, item: str):
+        """Select a service item value from a BigQuery table."""
         item_info = [{
             "name": "item_name",
             "type": "STRING",
@@ -1,6 +1,22 @@
+import asyncio
+import datetime
 import unittest
-from unittest.mock import MagicMock, patch
-from google.cloud.bigquery import QueryJobConfig, ScalarQueryParameter
+from unittest.mock import MagicMock, call, patch
+from google.cloud.bigquery import (
+    ArrayQueryParameter,
+    QueryJobConfig,
+    QueryPriority,
+    ScalarQueryParameter
+)
+from google.protobuf.wrappers_pb2 import StringValue
+
+try:
+    from google.cloud.bigquery_storage_v1.types import (
+        AppendRowsResponse,
+        RowError
+    )
+except ImportError:
+    AppendRowsResponse = RowError = None
 
 from bigquery_manager import set_bigquery_client, BigQueryManager
 
@@ -42,6 +58,46 @@ class TestBigQueryManager(unittest.TestCase):
         )
         self.assertEqual(result, "result")
 
+    def test_query_batch(self):
+        self.bq_manager.select("dataset.table", "select_column", batch=True)
+        job_config = self.client.query.call_args.kwargs["job_config"]
+        self.assertEqual(job_config.priority, QueryPriority.BATCH)
+
+    def test_submit(self):
+        job = self.bq_manager.submit("SELECT 1")
+        self.client.query.assert_called_once_with(query="SELECT 1")
+        self.assertIs(job, self.client.query.return_value)
+        job.result.assert_not_called()
+
+    def test_aquery(self):
+        self.client.query.return_value.result.return_value = "result"
+
+        async def run():
+            return await asyncio.gather(
+                self.bq_manager.aquery("SELECT 1"),
+                self.bq_manager.aquery("SELECT 2")
+            )
+        self.assertEqual(asyncio.run(run()), ["result", "result"])
+        self.assertEqual(self.client.query.call_count, 2)
+
+    def test_query_arrow(self):
+        job = self.client.query.return_value
+        job.to_arrow.return_value = "arrow_table"
+
+        result = self.bq_manager.query_arrow("SELECT 1")
+        job.to_arrow.assert_called_once_with(create_bqstorage_client=True)
+        job.result.assert_not_called()
+        self.assertEqual(result, "arrow_table")
+
+    def test_query_df(self):
+        job = self.client.query.return_value
+        job.to_dataframe.return_value = "dataframe"
+
+        result = self.bq_manager.query_df("SELECT 1")
+        job.to_dataframe.assert_called_once_with(create_bqstorage_client=True)
+        job.result.assert_not_called()
+        self.assertEqual(result, "dataframe")
+
     @patch('bigquery_manager.manager.QueryJobConfig')
     def test_invoke(self, mock_job_config):
         self.client.query.return_value.result.return_value = "result"
@@ -75,6 +131,24 @@ class TestBigQueryManager(unittest.TestCase):
         )
         self.assertEqual(result, "result")
 
+    def test_invoke_array_param(self):
+        self.bq_manager.invoke(
+            "dataset.stored_procedure",
+            [{"type": "INT64", "value": [1, 2]}]
+        )
+        kwargs = self.client.query.call_args.kwargs
+        self.assertEqual(kwargs["query"], "CALL `dataset.stored_procedure`(?);")
+        self.assertEqual(
+            kwargs["job_config"].query_parameters,
+            [ArrayQueryParameter(None, "INT64", [1, 2])]
+        )
+
+    def test_invoke_quoted_sp(self):
+        self.bq_manager.invoke("`project.dataset.stored_procedure`")
+        self.client.query.assert_called_once_with(
+            query="CALL `project.dataset.stored_procedure`();"
+        )
+
     @patch('bigquery_manager.manager.QueryJobConfig')
     def test_select(self, mock_job_config):
         self.client.query.return_value.result.return_value = "result"
@@ -110,6 +184,54 @@ class TestBigQueryManager(unittest.TestCase):
         )
         self.assertEqual(result, "result")
 
+    def test_query_param_without_value(self):
+        self.bq_manager.query("SELECT @x", [{"name": "x", "type": "STRING"}])
+        self.assertEqual(
+            self.client.query.call_args.kwargs["job_config"].query_parameters,
+            [ScalarQueryParameter("x", "STRING", None)]
+        )
+
+    def test_select_in_filter(self):
+        filters = [
+            {"name": "param1", "type": "STRING", "value": ["a", "b"], "op": "IN"},
+            {"name": "param2", "type": "INT64", "value": 1}
+        ]
+        self.bq_manager.select("dataset.table", "select_column", filters)
+
+        kwargs = self.client.query.call_args.kwargs
+        self.assertEqual(
+            kwargs["query"],
+            "SELECT select_column FROM `dataset.table` "
+            "WHERE param1 IN UNNEST(@param1) AND param2 = @param2;"
+        )
+        self.assertEqual(
+            kwargs["job_config"].query_parameters,
+            [
+                ArrayQueryParameter("param1", "STRING", ["a", "b"]),
+                ScalarQueryParameter("param2", "INT64", 1)
+            ]
+        )
+
+    def test_select_in_filter_mismatch(self):
+        list_without_in = [{"name": "x", "type": "STRING", "value": ["a"]}]
+        in_without_list = [
+            {"name": "x", "type": "STRING", "value": "a", "op": "IN"}
+        ]
+        for filters in (list_without_in, in_without_list):
+            with self.assertRaises(ValueError):
+                self.bq_manager.select("dataset.table", "x", filters)
+        self.client.query.assert_not_called()
+
+        self.bq_manager.select(
+            "dataset.table",
+            "x",
+            [{"name": "x", "type": "STRING", "value": {"a"}, "op": "IN"}]
+        )
+        self.assertEqual(
+            self.client.query.call_args.kwargs["job_config"].query_parameters,
+            [ArrayQueryParameter("x", "STRING", ["a"])]
+        )
+
     def test_insert_success(self):
         self.client.insert_rows.return_value = []
         destination_table = "dataset.table"
@@ -129,6 +251,173 @@ class TestBigQueryManager(unittest.TestCase):
         )
         self.assertIsNone(res)
 
+    def test_insert_non_json_values(self):
+        self.client.insert_rows.return_value = []
+        data = [{"created_at": datetime.datetime(2024, 1, 1)}]
+        self.bq_manager.insert("dataset.table", data)
+
+        self.client.insert_rows.assert_called_once_with(
+            self.client.get_table("dataset.table"),
+            data,
+            None
+        )
+        self.client.insert_rows_json.assert_not_called()
+
+    def test_insert_json_rows(self):
+        self.client.insert_rows_json.return_value = []
+        data = [{"column1": "value1"}]
+        self.bq_manager.insert(
+            "dataset.table",
+            data,
+            json_rows=True,
+            skip_invalid_rows=True
+        )
+
+        self.client.insert_rows_json.assert_called_once_with(
+            self.client.get_table("dataset.table"),
+            data,
+            skip_invalid_rows=True
+        )
+        self.client.insert_rows.assert_not_called()
+
+        with self.assertRaises(ValueError):
+            self.bq_manager.insert(
+                "dataset.table",
+                data,
+                ["column1"],
+                json_rows=True
+            )
+
+    def test_insert_tuple_rows(self):
+        self.client.insert_rows.return_value = []
+        destination_table = "dataset.table"
+        data = [("value1", "value2")]
+        selected_fields = ["column1", "column2"]
+        self.bq_manager.insert(destination_table, data, selected_fields)
+
+        self.client.insert_rows.assert_called_once_with(
+            self.client.get_table(destination_table),
+            data,
+            selected_fields
+        )
+        self.client.insert_rows_json.assert_not_called()
+
+    def test_insert_chunks(self):
+        self.client.insert_rows.return_value = []
+        destination_table = "dataset.table"
+        data = [{"column1": i} for i in range(5)]
+        self.bq_manager.insert(destination_table, data, chunk_size=2)
+
+        self.client.get_table.assert_called_once_with(destination_table)
+        table = self.client.get_table.return_value
+        self.assertCountEqual(
+            self.client.insert_rows.call_args_list,
+            [
+                call(table, data[0:2], None),
+                call(table, data[2:4], None),
+                call(table, data[4:5], None)
+            ]
+        )
+
+    def test_insert_chunks_row_ids(self):
+        self.client.insert_rows.return_value = []
+        data = [{"column1": i} for i in range(4)]
+        self.bq_manager.insert(
+            "dataset.table",
+            data,
+            chunk_size=2,
+            row_ids=["a", "b", "c", "d"]
+        )
+
+        table = self.client.get_table.return_value
+        self.assertEqual(
+            self.client.insert_rows.call_args_list,
+            [
+                call(table, data[0:2], None, row_ids=["a", "b"]),
+                call(table, data[2:4], None, row_ids=["c", "d"])
+            ]
+        )
+
+    def test_insert_iterator(self):
+        self.client.insert_rows.return_value = []
+        data = [{"column1": i} for i in range(3)]
+        self.bq_manager.insert(
+            "dataset.table",
+            (row for row in data),
+            chunk_size=2
+        )
+
+        table = self.client.get_table.return_value
+        self.assertEqual(
+            self.client.insert_rows.call_args_list,
+            [call(table, data[0:2], None), call(table, data[2:3], None)]
+        )
+
+    @patch('bigquery_manager.manager.ThreadPoolExecutor')
+    def test_insert_single_chunk_inline(self, mock_executor):
+        self.client.insert_rows.return_value = []
+        self.bq_manager.insert("dataset.table", [{"column1": "value1"}])
+        mock_executor.assert_not_called()
+        self.client.insert_rows.assert_called_once()
+
+    def test_insert_caches_table(self):
+        self.client.insert_rows.return_value = []
+        data = [{"column1": "value1"}]
+        self.bq_manager.insert("dataset.table", data)
+        self.bq_manager.insert("dataset.table", data)
+        self.client.get_table.assert_called_once_with("dataset.table")
+
+        self.bq_manager.clear_cache()
+        self.bq_manager.insert("dataset.table", data)
+        self.assertEqual(self.client.get_table.call_count, 2)
+
+    @patch('bigquery_manager.manager.time.monotonic')
+    def test_insert_table_cache_expires(self, mock_monotonic):
+        self.client.insert_rows.return_value = []
+        data = [{"column1": "value1"}]
+        mock_monotonic.return_value = 0
+        self.bq_manager.insert("dataset.table", data)
+        mock_monotonic.return_value = 299
+        self.bq_manager.insert("dataset.table", data)
+        self.assertEqual(self.client.get_table.call_count, 1)
+
+        mock_monotonic.return_value = 301
+        self.bq_manager.insert("dataset.table", data)
+        self.assertEqual(self.client.get_table.call_count, 2)
+
+    def test_insert_failure_aggregates_chunks(self):
+        def insert_rows(table, rows, selected_fields):
+            if rows[0]["column1"] != 1:
+                return [{"index": 0, "errors": ["bad row"]}]
+            return []
+        self.client.insert_rows.side_effect = insert_rows
+        data = [{"column1": i} for i in range(3)]
+
+        with self.assertRaises(RuntimeError) as error_context:
+            self.bq_manager.insert("dataset.table", data, chunk_size=1)
+        self.assertEqual(
+            error_context.exception.args[0],
+            [
+                {"index": 0, "errors": ["bad row"]},
+                {"index": 2, "errors": ["bad row"]}
+            ]
+        )
+
+    def test_insert_failure_error_index(self):
+        def insert_rows(table, rows, selected_fields):
+            if rows[0]["column1"] == 2:
+                return [{"index": 0, "errors": ["bad row"]}]
+            return []
+        self.client.insert_rows.side_effect = insert_rows
+        data = [{"column1": i} for i in range(4)]
+
+        with self.assertRaises(RuntimeError) as error_context:
+            self.bq_manager.insert("dataset.table", data, chunk_size=2)
+        self.assertEqual(
+            error_context.exception.args[0],
+            [{"index": 2, "errors": ["bad row"]}]
+        )
+
     def test_insert_failure(self):
         mock_error = ['error when insert to bigquery']
         self.client.insert_rows.return_value = mock_error
@@ -140,6 +429,135 @@ class TestBigQueryManager(unittest.TestCase):
         exception = error_context.exception
         self.assertIn(str(mock_error), str(exception))
 
+    @unittest.skipUnless(
+        AppendRowsResponse,
+        "google-cloud-bigquery-storage is not installed"
+    )
+    @patch('google.cloud.bigquery_storage_v1.BigQueryWriteClient')
+    def test_bulk_insert(self, mock_write_client):
+        append_rows = mock_write_client.return_value.append_rows
+        append_rows.return_value = iter([AppendRowsResponse()])
+        rows = [StringValue(value="a"), StringValue(value="b")]
+        self.bq_manager.bulk_insert(
+            "project.dataset.table",
+            rows,
+            StringValue.DESCRIPTOR,
+            chunk_size=1
+        )
+
+        stream = "projects/project/datasets/dataset/tables/table/streams/_default"
+        requests = list(append_rows.call_args.args[0])
+        self.assertEqual(len(requests), 2)
+        self.assertEqual(requests[0].write_stream, stream)
+        self.assertEqual(
+            list(requests[1].proto_rows.rows.serialized_rows),
+            [rows[1].SerializeToString()]
+        )
+
+    @unittest.skipUnless(
+        AppendRowsResponse,
+        "google-cloud-bigquery-storage is not installed"
+    )
+    @patch('google.cloud.bigquery_storage_v1.BigQueryWriteClient')
+    def test_bulk_insert_failure(self, mock_write_client):
+        mock_write_client.return_value.append_rows.return_value = iter([
+            AppendRowsResponse(row_errors=[RowError(index=0, message="bad")])
+        ])
+
+        with self.assertRaises(RuntimeError):
+            self.bq_manager.bulk_insert(
+                "project.dataset.table",
+                [StringValue(value="a")],
+                StringValue.DESCRIPTOR
+            )
+
+    def test_bulk_insert_df(self):
+        load = self.client.load_table_from_dataframe
+        load.return_value.result.return_value = "load_result"
+        df = MagicMock()
+
+        result = self.bq_manager.bulk_insert_df(
+            "dataset.table",
+            df,
+            write_disposition="WRITE_APPEND"
+        )
+        args, kwargs = load.call_args
+        self.assertEqual(args, (df, "dataset.table"))
+        self.assertEqual(kwargs["job_config"].write_disposition, "WRITE_APPEND")
+        self.assertEqual(result, "load_result")
+
+    def test_get_last_id(self):
+        self.client.query.return_value.result.side_effect = [
+            iter([(42,)]),
+            iter([(None,)])
+        ]
+        self.assertEqual(self.bq_manager.get_last_id("dataset.table"), 42)
+        self.assertEqual(self.bq_manager.get_last_id("dataset.table"), 0)
+        self.client.query.assert_called_with(
+            query="SELECT MAX(Id) FROM `dataset.table`;"
+        )
+
+    def test_get_service_item(self):
+        self.client.query.return_value.result.side_effect = lambda: iter(
+            [("value",)]
+        )
+        self.assertEqual(
+            self.bq_manager.get_service_item("dataset.items", "key"),
+            "value"
+        )
+        self.bq_manager.get_service_item("dataset.items", "key")
+        self.assertEqual(self.client.query.call_count, 2)
+
+    def test_get_service_item_cached(self):
+        self.client.query.return_value.result.side_effect = lambda: iter(
+            [("value",)]
+        )
+        self.assertEqual(
+            self.bq_manager.get_service_item(
+                "dataset.items",
+                "key",
+                cached=True
+            ),
+            "value"
+        )
+        self.bq_manager.get_service_item("dataset.items", "key", cached=True)
+        self.assertEqual(self.client.query.call_count, 1)
+
+        self.bq_manager.get_service_item(
+            "dataset.items",
+            "other_key",
+            cached=True
+        )
+        self.assertEqual(self.client.query.call_count, 2)
+
+    @patch('bigquery_manager.manager.time.monotonic')
+    def test_get_service_item_ttl(self, mock_monotonic):
+        self.client.query.return_value.result.side_effect = lambda: iter(
+            [("value",)]
+        )
+        bq_manager = BigQueryManager(self.client, cache_ttl=60)
+        mock_monotonic.return_value = 0
+        bq_manager.get_service_item("dataset.items", "key", cached=True)
+        mock_monotonic.return_value = 59
+        bq_manager.get_service_item("dataset.items", "key", cached=True)
+        self.assertEqual(self.client.query.call_count, 1)
+
+        mock_monotonic.return_value = 61
+        bq_manager.get_service_item("dataset.items", "key", cached=True)
+        self.assertEqual(self.client.query.call_count, 2)
+
+    @patch('bigquery_manager.manager._CACHE_MAXSIZE', 2)
+    def test_get_service_item_cache_size(self):
+        self.client.query.return_value.result.side_effect = lambda: iter(
+            [("value",)]
+        )
+        for item in ("a", "b", "c", "a"):
+            self.bq_manager.get_service_item("dataset.items", item, cached=True)
+        self.assertEqual(self.client.query.call_count, 4)
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.bq_manager, "__dict__"))
+
     def test_get_one_result(self):
         query_res_with_result = iter([("result_value",)])
         query_res_empty = iter([])
@@ -150,6 +568,11 @@ class TestBigQueryManager(unittest.TestCase):
         self.assertEqual(result_with_value, "result_value")
         self.assertIsNone(result_empty)
 
+    def test_get_one_result_known_empty(self):
+        query_res = MagicMock(total_rows=0)
+        self.assertIsNone(self.bq_manager.get_one_result(query_res))
+        query_res.__iter__.assert_not_called()
+
 
 class MockQueryJobConfig(QueryJobConfig):
     def __str__(self):